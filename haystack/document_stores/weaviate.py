@@ -1,13 +1,25 @@
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Sequence, Set, Tuple, Union, overload
 import re
+import math
 import uuid
 import json
 import hashlib
 import logging
+import time
+import copy
+import functools
+import threading
+import sqlite3
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import numpy as np
+import pandas as pd
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 import weaviate
 
 try:
@@ -25,7 +37,199 @@ from haystack.document_stores.utils import convert_date_to_rfc3339
 
 
 logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def _json_loads(s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN that json.dumps() writes for missing cells of tables
+            return json.loads(s)
+
+except (ImportError, ModuleNotFoundError):
+    logger.info("orjson not found, falling back to the json module. Enable it with 'pip install orjson'.")
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+    def _json_loads(s: str) -> Any:
+        return json.loads(s)
+
+
+def _normalize_embeddings_numpy(embeddings: np.ndarray) -> None:
+    """
+    L2 normalization of a (n, embedding_dim) matrix inplace. Rows with a norm of zero are left untouched.
+    """
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    np.divide(embeddings, norms, out=embeddings, where=norms > 0)
+
+
+_normalize_embeddings_batch: Callable[[np.ndarray], None] = _normalize_embeddings_numpy
+try:
+    from numba import njit  # pylint: disable=import-error
+
+    # Not parallel=True: parallel kernels abort the process when they are called from several threads at once
+    # under numba's default workqueue threading layer, and the store calls this from its request threads
+    @njit(fastmath=True, cache=True)
+    def _normalize_embeddings_numba(embeddings: np.ndarray) -> None:
+        """
+        Compiled version of `_normalize_embeddings_numpy()` that normalizes each row in a single pass.
+        """
+        n, dim = embeddings.shape
+        for i in range(n):
+            squared_sum = 0.0
+            for j in range(dim):
+                squared_sum += embeddings[i, j] * embeddings[i, j]
+            if squared_sum > 0.0:
+                inv_norm = 1.0 / math.sqrt(squared_sum)
+                for j in range(dim):
+                    embeddings[i, j] *= inv_norm
+
+    _normalize_embeddings_batch = _normalize_embeddings_numba
+except (ImportError, ModuleNotFoundError):
+    logger.info("Numba not found, normalizing embeddings with NumPy. Enable it with 'pip install numba'.")
+
+
+# Seconds for which the properties of an index are served from the cache before the schema is fetched again
+SCHEMA_CACHE_TTL = 30
+# Upper bound for the number of requests that are sent to Weaviate concurrently
+MAX_CONCURRENT_REQUESTS = 8
+_EXECUTOR_THREAD_NAME_PREFIX = "weaviate-document-store"
 UUID_PATTERN = re.compile(r"^[\da-f]{8}-([\da-f]{4}-){3}[\da-f]{12}$", re.IGNORECASE)
+_UUID_CHARACTERS = frozenset("0123456789abcdefABCDEF-")
+# Every string that datetime.fromisoformat() accepts starts with a four digit year
+_DATE_PREFIX_PATTERN = re.compile(r"^\d{4}")
+
+
+def _is_uuid(id: str) -> bool:
+    """
+    Check whether the id is in uuid format. Plain string checks of the fixed uuid layout are used for the common
+    case, the regex only decides for ids that don't pass them.
+    """
+    if (
+        len(id) == 36
+        and id[8] == id[13] == id[18] == id[23] == "-"
+        and id.count("-") == 4
+        and _UUID_CHARACTERS.issuperset(id)
+    ):
+        return True
+    return UUID_PATTERN.match(id) is not None
+
+
+def _freeze(obj: Any) -> Any:
+    """
+    Convert a filter dict into a hashable representation of nested tuples. Every value is tagged with its type, so
+    that `_thaw()` can restore the original structure and values that are equal but of different types (1, 1.0 and
+    True) don't share a cache entry, as they are converted to different Weaviate value types.
+    """
+    if isinstance(obj, dict):
+        return ("dict", tuple(sorted((key, _freeze(value)) for key, value in obj.items())))
+    if isinstance(obj, (list, tuple)):
+        return ("list", tuple(_freeze(value) for value in obj))
+    return (type(obj).__name__, obj)
+
+
+def _thaw(obj: Any) -> Any:
+    tag, value = obj
+    if tag == "dict":
+        return {key: _thaw(item) for key, item in value}
+    if tag == "list":
+        return [_thaw(item) for item in value]
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_frozen_filters(frozen_filters: Any) -> dict:
+    return LogicalFilterClause.parse(_thaw(frozen_filters)).convert_to_weaviate()
+
+
+def _convert_filters(filters: Optional[Dict[str, Any]]) -> Optional[dict]:
+    """
+    Convert Haystack filters into a Weaviate `where` filter. The conversion is cached per filter, so the returned
+    dict is shared between calls and must not be modified.
+    """
+    if not filters:
+        return None
+    try:
+        return _compile_frozen_filters(_freeze(filters))
+    except TypeError:
+        # Filters with unhashable values can't be cached
+        return LogicalFilterClause.parse(filters).convert_to_weaviate()
+
+
+class _SemanticQueryCache:
+    """
+    LRU cache with a time to live for the results of embedding queries. Besides exact hits, a query is answered
+    from the cache if a cached query of the same scope (index, filters, top_k, ...) has a cosine similarity of at
+    least `threshold` to it. The query embeddings are expected to be L2 normalized.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, threshold: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        # (scope, hash of the quantized query embedding) -> (time of insertion, query embedding, documents)
+        self._entries: "OrderedDict[Tuple[Any, bytes], Tuple[float, np.ndarray, List[Document]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _quantized_hash(query_emb: np.ndarray) -> bytes:
+        quantized = np.round(np.clip(query_emb, -1.0, 1.0) * 127).astype(np.int8)
+        return hashlib.sha256(quantized.tobytes()).digest()
+
+    def get(self, scope: Any, query_emb: np.ndarray) -> Optional[List[Document]]:
+        with self._lock:
+            expired_before = time.monotonic() - self.ttl
+            key = (scope, self._quantized_hash(query_emb))
+            entry = self._entries.get(key)
+            # Different vectors can quantize to the same hash, so a hash hit must pass the threshold as well.
+            # Identical vectors always match, their dot product can be rounded to slightly below 1.0.
+            if (
+                entry is None
+                or entry[0] < expired_before
+                or not (np.array_equal(entry[1], query_emb) or float(entry[1] @ query_emb) >= self.threshold)
+            ):
+                candidates = [
+                    (candidate_key, candidate[1])
+                    for candidate_key, candidate in self._entries.items()
+                    if candidate_key[0] == scope and candidate[0] >= expired_before
+                ]
+                if not candidates:
+                    return None
+                similarities = np.stack([vector for _, vector in candidates]) @ query_emb
+                best = int(np.argmax(similarities))
+                if similarities[best] < self.threshold:
+                    return None
+                key = candidates[best][0]
+                entry = self._entries[key]
+            self._entries.move_to_end(key)
+            # Deep copies, so that callers changing e.g. the score, meta or embedding of a document don't change
+            # the cached result
+            return copy.deepcopy(entry[2])
+
+    def put(self, scope: Any, query_emb: np.ndarray, documents: List[Document]):
+        with self._lock:
+            key = (scope, self._quantized_hash(query_emb))
+            self._entries[key] = (time.monotonic(), query_emb.copy(), copy.deepcopy(documents))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, index: Optional[str] = None):
+        """
+        Drop the cached results of the given index, or of all indices if index is None.
+        """
+        with self._lock:
+            if index is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0][0] == index]:
+                del self._entries[key]
 
 
 class WeaviateDocumentStore(BaseDocumentStore):
@@ -70,6 +274,12 @@ class WeaviateDocumentStore(BaseDocumentStore):
         embedding_field: str = "embedding",
         progress_bar: bool = True,
         duplicate_documents: str = "overwrite",
+        embedding_cache_path: Optional[str] = None,
+        connection_pool_size: int = 64,
+        embedding_dtype: str = "float32",
+        query_cache_size: int = 0,
+        query_cache_ttl: float = 300,
+        query_cache_threshold: float = 0.97,
         **kwargs,
     ):
         """
@@ -102,9 +312,32 @@ class WeaviateDocumentStore(BaseDocumentStore):
                                     skip: Ignore the duplicates documents
                                     overwrite: Update any existing documents with the same ID when adding documents.
                                     fail: an error is raised if the document ID of the document being added already exists.
+        :param embedding_cache_path: Path of an on-disk cache (a SQLite database) that maps the hash of a document's
+                                     content to its embedding. If set, the embeddings of written documents and of
+                                     documents updated via `update_embeddings()` are stored in it, and documents
+                                     that are written without an embedding get the cached embedding of the same
+                                     content instead of a dummy embedding. The file can be shared by several
+                                     document stores and processes. Default: None (no cache).
+        :param connection_pool_size: Number of keep-alive connections to the Weaviate server that are kept open and
+                                     reused across requests. Default: 64.
+        :param embedding_dtype: Data type of the embeddings of returned documents, either 'float32' or 'float16'.
+                                'float16' halves the memory of documents loaded with `return_embedding=True`,
+                                the vectors stored in Weaviate are not affected. Default: 'float32'.
+        :param query_cache_size: Maximum number of `query_by_embedding()` results that are kept in an in-process
+                                 cache. A query is answered from the cache without a request to Weaviate if a cached
+                                 query with the same index, filters, top_k and return_embedding has a cosine
+                                 similarity of at least `query_cache_threshold` to it. Writes, updates and deletes
+                                 invalidate the cached results of their index. Default: 0 (no cache).
+        :param query_cache_ttl: Seconds after which a cached query result expires. Default: 300.
+        :param query_cache_threshold: Minimum cosine similarity of a cached query to the current query for its result
+                                      to be returned. Use 1.0 for exact matches only. Default: 0.97.
         """
         if similarity != "cosine":
             raise ValueError(f"Weaviate only supports cosine similarity, but you provided {similarity}")
+        if embedding_dtype not in ("float32", "float16"):
+            raise ValueError(
+                f"embedding_dtype must be either 'float32' or 'float16', but you provided {embedding_dtype}"
+            )
 
         super().__init__()
 
@@ -117,6 +350,7 @@ class WeaviateDocumentStore(BaseDocumentStore):
             )
         else:
             self.weaviate_client = client.Client(url=weaviate_url, timeout_config=timeout_config)
+        self._configure_connection_pool(connection_pool_size)
 
         # Test Weaviate connection
         try:
@@ -131,7 +365,9 @@ class WeaviateDocumentStore(BaseDocumentStore):
                 f"Initial connection to Weaviate failed. Make sure you run Weaviate instance "
                 f"at `{weaviate_url}` and that it has finished the initial ramp up (can take > 30s)."
             )
-        self.index = self._sanitize_index_name(index)
+        # index name -> sanitized index name
+        self._sanitized_index_cache: Dict[str, str] = {}
+        self.index: str = self._sanitize_index_name(index)
         self.embedding_dim = embedding_dim
         self.content_field = content_field
         self.name_field = name_field
@@ -142,17 +378,69 @@ class WeaviateDocumentStore(BaseDocumentStore):
         self.embedding_field = embedding_field
         self.progress_bar = progress_bar
         self.duplicate_documents = duplicate_documents
+        self.embedding_dtype = np.dtype(embedding_dtype)
+        # index -> (time of the lookup, all properties, date properties)
+        self._schema_cache: Dict[str, Tuple[float, List[str], List[str]]] = {}
+        # (index, return_embedding) -> (schema properties the entry was built from, properties to query)
+        self._properties_cache: Dict[Tuple[str, bool], Tuple[List[str], List[str]]] = {}
+        # (index, properties, filters, top_k) -> GraphQL query before and after the vector of a nearVector query
+        self._query_template_cache: Dict[Tuple[str, Tuple[str, ...], Any, int], Tuple[str, str]] = {}
+        # Indices whose schema is known to exist, so that it doesn't have to be checked again
+        self._schema_ensured: Set[str] = set()
+        self.embedding_cache_path = embedding_cache_path
+        if self.embedding_cache_path:
+            with self._connect_embedding_cache() as connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings (content_hash BLOB PRIMARY KEY, embedding BLOB NOT NULL)"
+                )
+        # Threads are only started once requests are sent concurrently, see _map_concurrently()
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix=_EXECUTOR_THREAD_NAME_PREFIX
+        )
+        self._query_cache = (
+            _SemanticQueryCache(maxsize=query_cache_size, ttl=query_cache_ttl, threshold=query_cache_threshold)
+            if query_cache_size > 0
+            else None
+        )
 
         self._create_schema_and_index_if_not_exist(self.index)
         self.uuid_format_warning_raised = False
 
+    def _configure_connection_pool(self, pool_size: int):
+        """
+        Mount an adapter with a larger connection pool and retries for failed connections on the session
+        the Weaviate client uses, so that connections are kept alive and reused across requests.
+        """
+        session = getattr(self.weaviate_client._connection, "_session", None)
+        if session is None:
+            logger.debug("Weaviate client has no requests session, keeping its default connection handling.")
+            return
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+
+    @overload
+    def _sanitize_index_name(self, index: str) -> str:
+        ...
+
+    @overload
+    def _sanitize_index_name(self, index: None) -> None:
+        ...
+
     def _sanitize_index_name(self, index: Optional[str]) -> Optional[str]:
         if index is None:
             return None
-        elif "_" in index:
-            return "".join(x.capitalize() for x in index.split("_"))
-        else:
-            return index[0].upper() + index[1:]
+        sanitized_index = self._sanitized_index_cache.get(index)
+        if sanitized_index is None:
+            if "_" in index:
+                sanitized_index = "".join(x.capitalize() for x in index.split("_"))
+            else:
+                sanitized_index = index[0].upper() + index[1:]
+            self._sanitized_index_cache[index] = sanitized_index
+        return sanitized_index
 
     def _create_schema_and_index_if_not_exist(self, index: Optional[str] = None):
         """
@@ -160,6 +448,8 @@ class WeaviateDocumentStore(BaseDocumentStore):
         index (schema) with the name doesn't exist already.
         """
         index = self._sanitize_index_name(index) or self.index
+        if index in self._schema_ensured:
+            return
 
         if self.custom_schema:
             schema = self.custom_schema
@@ -184,12 +474,19 @@ class WeaviateDocumentStore(BaseDocumentStore):
             }
         if not self.weaviate_client.schema.contains(schema):
             self.weaviate_client.schema.create(schema)
+            self._schema_cache.clear()
+        self._schema_ensured.add(index)
 
-    def _convert_weaviate_result_to_document(self, result: dict, return_embedding: bool) -> Document:
+    def _convert_weaviate_result_to_document(
+        self, result: dict, return_embedding: bool, emb_out: Optional[np.ndarray] = None, row: Optional[int] = None
+    ) -> Document:
         """
         Convert weaviate result dict into haystack document object. This is more involved because
         weaviate search result dict varies between get and query interfaces.
         Weaviate get methods return the data items in properties key, whereas the query doesn't.
+
+        If a preallocated `emb_out` buffer of shape (n, embedding_dim) is passed, the embedding is copied into its
+        given `row` and the document's embedding is a view of that row.
         """
         score = None
         content = ""
@@ -217,7 +514,7 @@ class WeaviateDocumentStore(BaseDocumentStore):
 
         if props.get(self.content_field) is not None:
             # Converting JSON-string to original datatype (string or nested list)
-            content = json.loads(str(props.get(self.content_field)))
+            content = _json_loads(str(props.get(self.content_field)))
 
         content_type = None
         if props.get("content_type") is not None:
@@ -233,11 +530,20 @@ class WeaviateDocumentStore(BaseDocumentStore):
                 embedding = props["_additional"]["vector"]
             props.pop("_additional", None)
 
-        # We put all additional data of the doc into meta_data and return it in the API
-        meta_data = {k: v for k, v in props.items() if k not in (self.content_field, self.embedding_field)}
-
-        if return_embedding and embedding:
-            embedding = np.asarray(embedding, dtype=np.float32)
+        # We put all additional data of the doc into meta_data and return it in the API.
+        # The result dict is not used afterwards, so the remaining properties can be used as they are.
+        props.pop(self.content_field, None)
+        props.pop(self.embedding_field, None)
+        meta_data = props
+
+        if not return_embedding:
+            embedding = None
+        elif embedding:
+            if emb_out is not None and row is not None and len(embedding) == emb_out.shape[1]:
+                emb_out[row] = embedding
+                embedding = emb_out[row]
+            else:
+                embedding = np.asarray(embedding, dtype=self.embedding_dtype)
 
         document = Document.from_dict(
             {
@@ -251,6 +557,63 @@ class WeaviateDocumentStore(BaseDocumentStore):
         )
         return document
 
+    @staticmethod
+    def _get_content_hash(document: Document) -> Optional[bytes]:
+        """
+        Hash of the document's content used as key of the embedding cache. Only text content is cached.
+        """
+        if not isinstance(document.content, str):
+            return None
+        return hashlib.blake2b(document.content.encode("utf-8"), digest_size=16).digest()
+
+    @contextmanager
+    def _connect_embedding_cache(self) -> Iterator[sqlite3.Connection]:
+        """
+        Open a connection to the embedding cache that commits on success and is closed on exit.
+        A connection is opened per operation, so no handle is kept open and SQLite's locking serializes writers.
+        """
+        connection = sqlite3.connect(self.embedding_cache_path, timeout=30)  # type: ignore
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _lookup_embedding_cache(self, documents: List[Document]):
+        """
+        Set the cached embedding for all documents without an embedding whose content is in the embedding cache.
+        """
+        if not self.embedding_cache_path:
+            return
+        documents_without_embedding = [document for document in documents if document.embedding is None]
+        if not documents_without_embedding:
+            return
+        with self._connect_embedding_cache() as connection:
+            for document in documents_without_embedding:
+                content_hash = self._get_content_hash(document)
+                if content_hash is None:
+                    continue
+                row = connection.execute(
+                    "SELECT embedding FROM embeddings WHERE content_hash = ?", (content_hash,)
+                ).fetchone()
+                if row is not None and len(row[0]) == self.embedding_dim * 4:
+                    document.embedding = np.frombuffer(row[0], dtype=np.float32).copy()
+
+    def _write_embedding_cache(self, documents: List[Document], embeddings: List[np.ndarray]):
+        """
+        Store the embeddings of the documents in the embedding cache.
+        """
+        if not self.embedding_cache_path:
+            return
+        rows = []
+        for document, embedding in zip(documents, embeddings):
+            content_hash = self._get_content_hash(document)
+            if content_hash is not None and embedding is not None:
+                rows.append((content_hash, np.asarray(embedding, dtype=np.float32).tobytes()))
+        if rows:
+            with self._connect_embedding_cache() as connection:
+                connection.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?)", rows)
+
     def _create_document_field_map(self) -> Dict:
         return {self.content_field: "content", self.embedding_field: "embedding"}
 
@@ -288,27 +651,66 @@ class WeaviateDocumentStore(BaseDocumentStore):
             raise NotImplementedError("WeaviateDocumentStore does not support headers.")
 
         index = self._sanitize_index_name(index) or self.index
+        ids = [self._sanitize_id(id=id, index=index) for id in ids]
+
+        # Build the properties to retrieve from Weaviate
+        properties = self._get_query_properties(index, return_embedding=True)
+
+        # Fetch the documents with one filtered query per batch instead of one request per id.
+        # If there are several batches, their requests are sent concurrently.
+        id_batches = list(get_batches_from_generator(ids, batch_size))
+        results = self._map_concurrently(
+            lambda id_batch: self._get_documents_by_id_batch(id_batch, index, properties), id_batches
+        )
+
         documents = []
-        # TODO: better implementation with multiple where filters instead of chatty call below?
-        for id in ids:
-            id = self._sanitize_id(id=id, index=index)
-            result = None
-            try:
-                result = self.weaviate_client.data_object.get_by_id(id, with_vector=True)
-            except weaviate.exceptions.UnexpectedStatusCodeException as usce:
-                logging.debug(f"Weaviate could not get the document requested: {usce}")
-            if result:
-                document = self._convert_weaviate_result_to_document(result, return_embedding=True)
+        for hits in results:
+            for hit in hits:
+                document = self._convert_weaviate_result_to_document(hit, return_embedding=True)
                 documents.append(document)
         return documents
 
+    def _map_concurrently(self, function: Callable[[Any], Any], items: Sequence[Any]) -> List[Any]:
+        """
+        Call `function` for every item and return the results in the order of the items. If there is more than one
+        item, the calls run concurrently in the thread pool of the document store. The first exception raised by
+        `function` is re-raised.
+        """
+        # Calls from within the pool run sequentially, waiting for tasks of the same pool could deadlock it
+        if len(items) <= 1 or threading.current_thread().name.startswith(_EXECUTOR_THREAD_NAME_PREFIX):
+            return [function(item) for item in items]
+        return list(self._executor.map(function, items))
+
+    def _get_documents_by_id_batch(
+        self, ids: Sequence[str], index: str, properties: List[str], filter_dict: Optional[dict] = None
+    ) -> List[dict]:
+        """
+        Fetch the Weaviate results for a batch of sanitized ids with a single filtered query.
+        If a Weaviate `filter_dict` is passed, only the documents that also match it are returned.
+        """
+        id_conditions = [{"path": ["id"], "operator": "Equal", "valueString": id} for id in ids]
+        id_filter: Dict[str, Any]
+        if len(id_conditions) > 1:
+            id_filter = {"operator": "Or", "operands": id_conditions}
+        else:
+            id_filter = id_conditions[0]
+        filter_dict = {"operator": "And", "operands": [id_filter, filter_dict]} if filter_dict else id_filter
+        result = (
+            self.weaviate_client.query.get(class_name=index, properties=properties)
+            .with_where(filter_dict)
+            .with_limit(len(ids))
+            .do()
+        )
+
+        return self._extract_hits(result, index)
+
     def _sanitize_id(self, id: str, index: Optional[str] = None) -> str:
         """
         Generate a valid uuid if the provided id is not in uuid format.
         Two documents with the same provided id and index name will get the same uuid.
         """
         index = self._sanitize_index_name(index) or self.index
-        if not UUID_PATTERN.match(id):
+        if not _is_uuid(id):
             hashed_id = hashlib.sha256((id + index).encode("utf-8"))  # type: ignore
             generated_uuid = str(uuid.UUID(hashed_id.hexdigest()[::2]))
             if not self.uuid_format_warning_raised:
@@ -319,41 +721,80 @@ class WeaviateDocumentStore(BaseDocumentStore):
             id = generated_uuid
         return id
 
-    def _get_current_properties(self, index: Optional[str] = None) -> List[str]:
+    def _get_schema_properties(self, index: str) -> Tuple[List[str], List[str]]:
         """
-        Get all the existing properties in the schema.
+        Get all the existing properties and the properties of type 'date' from the schema.
+        The result is cached per index for SCHEMA_CACHE_TTL seconds.
         """
-        index = self._sanitize_index_name(index) or self.index
-        cur_properties = []
+        cached = self._schema_cache.get(index)
+        if cached is not None and time.monotonic() - cached[0] < SCHEMA_CACHE_TTL:
+            return cached[1], cached[2]
+
+        cur_properties: List[str] = []
+        date_properties: List[str] = []
         for class_item in self.weaviate_client.schema.get()["classes"]:
             if class_item["class"] == index:
                 cur_properties = [item["name"] for item in class_item["properties"]]
+                date_properties = [item["name"] for item in class_item["properties"] if item["dataType"][0] == "date"]
+
+        self._schema_cache[index] = (time.monotonic(), cur_properties, date_properties)
+        return cur_properties, date_properties
 
-        return cur_properties
+    def _get_current_properties(self, index: Optional[str] = None) -> List[str]:
+        """
+        Get all the existing properties in the schema.
+        """
+        index = self._sanitize_index_name(index) or self.index
+        cur_properties, _ = self._get_schema_properties(index)
+        return list(cur_properties)
 
     def _get_date_properties(self, index: Optional[str] = None) -> List[str]:
         """
         Get all existing properties of type 'date' in the schema.
         """
         index = self._sanitize_index_name(index) or self.index
-        cur_properties = []
-        for class_item in self.weaviate_client.schema.get()["classes"]:
-            if class_item["class"] == index:
-                cur_properties = [item["name"] for item in class_item["properties"] if item["dataType"][0] == "date"]
-
-        return cur_properties
+        _, date_properties = self._get_schema_properties(index)
+        return list(date_properties)
 
     def _update_schema(
         self, new_prop: str, property_value: Union[List, str, int, float, bool], index: Optional[str] = None
-    ):
+    ) -> str:
         """
-        Updates the schema with a new property.
+        Updates the schema with a new property and returns the Weaviate data type of the property.
+        If the property has been added in the meantime, e.g. by another process, the data type of the existing
+        property is returned instead.
         """
         index = self._sanitize_index_name(index) or self.index
         data_type = self._get_weaviate_type_of_value(property_value)
 
         property_dict = {"dataType": [data_type], "description": f"dynamic property {new_prop}", "name": new_prop}
-        self.weaviate_client.schema.property.create(index, property_dict)
+        try:
+            self.weaviate_client.schema.property.create(index, property_dict)
+        except weaviate.exceptions.UnexpectedStatusCodeException as usce:
+            # The cached properties can be outdated, Weaviate rejects properties that already exist with a 422
+            self._schema_cache.pop(index, None)
+            if usce.status_code != 422:
+                raise
+            existing_properties = self.weaviate_client.schema.get(index).get("properties") or []
+            existing_data_types = [item["dataType"][0] for item in existing_properties if item["name"] == new_prop]
+            if not existing_data_types:
+                raise
+            return existing_data_types[0]
+        self._schema_cache.pop(index, None)
+        return data_type
+
+    def _batch_update_schema(
+        self, new_props: Dict[str, Union[List, str, int, float, bool]], index: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Updates the schema with several new properties, sending the requests concurrently.
+        Returns the Weaviate data type of every added property.
+        """
+        index = self._sanitize_index_name(index) or self.index
+        data_types = self._map_concurrently(
+            lambda item: self._update_schema(item[0], item[1], index), list(new_props.items())
+        )
+        return dict(zip(new_props.keys(), data_types))
 
     @staticmethod
     def _get_weaviate_type_of_value(value: Union[List, str, int, float, bool]) -> str:
@@ -367,13 +808,17 @@ class WeaviateDocumentStore(BaseDocumentStore):
             value = value[0]
 
         if isinstance(value, str):
-            # If the value is parsable by datetime, it is a date
-            try:
-                convert_date_to_rfc3339(value)
-                data_type = "date"
-            # Otherwise, the value is a string
-            except ValueError:
+            # Strings that can't be a date are rejected without trying to parse them
+            if not _DATE_PREFIX_PATTERN.match(value):
                 data_type = "string"
+            else:
+                # If the value is parsable by datetime, it is a date
+                try:
+                    convert_date_to_rfc3339(value)
+                    data_type = "date"
+                # Otherwise, the value is a string
+                except ValueError:
+                    data_type = "string"
         elif isinstance(value, int):
             data_type = "int"
         elif isinstance(value, float):
@@ -386,7 +831,7 @@ class WeaviateDocumentStore(BaseDocumentStore):
 
         return data_type
 
-    def _check_document(self, cur_props: List[str], doc: dict) -> List[str]:
+    def _check_document(self, cur_props: Union[List[str], Set[str]], doc: dict) -> List[str]:
         """
         Find the properties in the document that don't exist in the existing schema.
         """
@@ -432,8 +877,9 @@ class WeaviateDocumentStore(BaseDocumentStore):
             return
 
         # Auto schema feature https://github.com/semi-technologies/weaviate/issues/1539
-        # Get and cache current properties in the schema
-        current_properties = self._get_current_properties(index)
+        # Get and cache current and date properties in the schema, they are only updated locally from here on
+        current_properties = set(self._get_current_properties(index))
+        date_fields = set(self._get_date_properties(index))
 
         document_objects = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
 
@@ -447,74 +893,120 @@ class WeaviateDocumentStore(BaseDocumentStore):
             documents=document_objects, index=index, duplicate_documents=duplicate_documents
         )
 
+        # Reuse the embeddings of already known content and remember the ones that are provided
+        if self.embedding_cache_path:
+            self._lookup_embedding_cache(document_objects)
+            docs_with_embedding = [do for do in document_objects if do.embedding is not None]
+            self._write_embedding_cache(docs_with_embedding, [do.embedding for do in docs_with_embedding])
+
         # Weaviate requires that documents contain a vector in order to be indexed. These lines add a
         # dummy vector so that indexing can still happen
-        dummy_embed_warning_raised = False
-        for do in document_objects:
-            if do.embedding is None:
-                dummy_embedding = np.random.rand(self.embedding_dim).astype(np.float32)
+        docs_without_embedding = [do for do in document_objects if do.embedding is None]
+        if docs_without_embedding:
+            logger.warning(
+                "No embedding found in Document object being written into Weaviate. A dummy "
+                "embedding is being supplied so that indexing can still take place. This "
+                "embedding should be overwritten in order to perform vector similarity searches."
+            )
+            # Generate all dummy embeddings at once instead of one small array per document
+            dummy_embeddings = np.random.default_rng().random(
+                (len(docs_without_embedding), self.embedding_dim), dtype=np.float32
+            )
+            for do, dummy_embedding in zip(docs_without_embedding, dummy_embeddings):
                 do.embedding = dummy_embedding
-                if not dummy_embed_warning_raised:
-                    logger.warning(
-                        "No embedding found in Document object being written into Weaviate. A dummy "
-                        "embedding is being supplied so that indexing can still take place. This "
-                        "embedding should be overwritten in order to perform vector similarity searches."
-                    )
-                    dummy_embed_warning_raised = True
 
+        # The client's batch context manager sends a request as soon as batch_size objects have been added
+        # and flushes the remaining objects on exit. Failed objects are reported via the callback.
+        self.weaviate_client.batch.configure(
+            batch_size=batch_size, dynamic=False, timeout_retries=3, callback=self._log_batch_errors
+        )
         batched_documents = get_batches_from_generator(document_objects, batch_size)
-        with tqdm(total=len(document_objects), disable=not self.progress_bar) as progress_bar:
-            for document_batch in batched_documents:
-                for idx, doc in enumerate(document_batch):
-                    _doc = {**doc.to_dict(field_map=self._create_document_field_map())}
-                    _ = _doc.pop("score", None)
-
-                    # In order to have a flat structure in elastic + similar behaviour to the other DocumentStores,
-                    # we "unnest" all value within "meta"
-                    if "meta" in _doc.keys():
-                        for k, v in _doc["meta"].items():
-                            _doc[k] = v
-                        _doc.pop("meta")
-
-                    doc_id = str(_doc.pop("id"))
-                    vector = _doc.pop(self.embedding_field)
+        with tqdm(
+            total=len(document_objects),
+            disable=not self.progress_bar,
+            mininterval=0.5,
+            miniters=max(1, batch_size // 10),
+            smoothing=0,
+        ) as progress_bar:
+            with self.weaviate_client.batch as batch:
+                for document_batch in batched_documents:
+                    data_objects = []
+                    vectors = []
+                    # Additional properties of the batch that are not in the schema yet, mapped to their first value
+                    new_properties: Dict[str, Any] = {}
+                    for doc in document_batch:
+                        _doc, doc_id, vector = self._doc_to_weaviate_payload(doc)
+                        vectors.append(vector)
+
+                        # Check if additional properties are in the document, if so,
+                        # collect them to append the schema with all of them at once.
+                        # Once the schema is stable, the subset check is all that runs per document.
+                        if not current_properties.issuperset(_doc):
+                            for property in self._check_document(current_properties, _doc):
+                                new_properties[property] = _doc[property]
+                                current_properties.add(property)
+
+                        data_objects.append((_doc, doc_id))
+
+                    if new_properties:
+                        new_data_types = self._batch_update_schema(new_properties, index)
+                        date_fields.update(prop for prop, data_type in new_data_types.items() if data_type == "date")
 
+                    # Weaviate requires dates to be in RFC3339 format
+                    if date_fields:
+                        for _doc, _ in data_objects:
+                            for date_field in date_fields:
+                                if date_field in _doc:
+                                    _doc[date_field] = convert_date_to_rfc3339(_doc[date_field])
+
+                    # Normalize the embeddings of the whole batch at once
+                    batch_vectors = np.stack(vectors).astype(np.float32, copy=False)
                     if self.similarity == "cosine":
-                        self.normalize_embedding(vector)
+                        _normalize_embeddings_batch(batch_vectors)
 
-                    # Converting content to JSON-string as Weaviate doesn't allow other nested list for tables
-                    _doc["content"] = json.dumps(_doc["content"])
+                    for (_doc, doc_id), vector in zip(data_objects, batch_vectors):
+                        batch.add_data_object(data_object=_doc, class_name=index, uuid=doc_id, vector=vector)
+                    progress_bar.update(len(document_batch))
+        self._invalidate_query_cache(index)
 
-                    # Check if additional properties are in the document, if so,
-                    # append the schema with all the additional properties
-                    missing_props = self._check_document(current_properties, _doc)
-                    if missing_props:
-                        for property in missing_props:
-                            self._update_schema(property, _doc[property], index)
-                            current_properties.append(property)
+    def _doc_to_weaviate_payload(self, document: Document) -> Tuple[Dict[str, Any], str, np.ndarray]:
+        """
+        Build the Weaviate data object of a document and return it together with the document's id and embedding.
+        """
+        # Converting content to JSON-string as Weaviate doesn't allow other nested list for tables
+        content = document.content
+        if document.content_type == "table" and isinstance(content, pd.DataFrame):
+            # Tables are serialized with json, orjson would silently write missing cells (NaN) as null
+            serialized_content = json.dumps([content.columns.tolist()] + content.values.tolist())
+        else:
+            serialized_content = _json_dumps(content)
 
-                    # Weaviate requires dates to be in RFC3339 format
-                    date_fields = self._get_date_properties(index)
-                    for date_field in date_fields:
-                        _doc[date_field] = convert_date_to_rfc3339(_doc[date_field])
+        payload: Dict[str, Any] = {self.content_field: serialized_content, "content_type": document.content_type}
+        # In order to have a flat structure in elastic + similar behaviour to the other DocumentStores,
+        # we "unnest" all value within "meta"
+        payload.update(document.meta)
+        # write_documents() supplies a dummy embedding for documents without one
+        assert document.embedding is not None
+        return payload, str(document.id), document.embedding
 
-                    self.weaviate_client.batch.add_data_object(
-                        data_object=_doc, class_name=index, uuid=doc_id, vector=vector
-                    )
-                # Ingest a batch of documents
-                results = self.weaviate_client.batch.create_objects()
-                # Weaviate returns errors for every failed document in the batch
-                if results is not None:
-                    for result in results:
-                        if (
-                            "result" in result
-                            and "errors" in result["result"]
-                            and "error" in result["result"]["errors"]
-                        ):
-                            for message in result["result"]["errors"]["error"]:
-                                logger.error(f"{message['message']}")
-                progress_bar.update(batch_size)
-        progress_bar.close()
+    def _invalidate_query_cache(self, index: str):
+        """
+        Drop the cached query results of an index after its documents have changed.
+        """
+        if self._query_cache is not None:
+            self._query_cache.invalidate(index)
+
+    @staticmethod
+    def _log_batch_errors(results: Optional[List[dict]]):
+        """
+        Log the errors Weaviate returns for every failed document in a batch.
+        """
+        if results is None:
+            return
+        for result in results:
+            if "result" in result and "errors" in result["result"] and "error" in result["result"]["errors"]:
+                for message in result["result"]["errors"]["error"]:
+                    logger.error(f"{message['message']}")
 
     def update_document_meta(self, id: str, meta: Dict[str, Union[List, str, int, float, bool]], index: str = None):
         """
@@ -540,6 +1032,7 @@ class WeaviateDocumentStore(BaseDocumentStore):
                 meta[date_field] = convert_date_to_rfc3339(str(meta[date_field]))
 
         self.weaviate_client.data_object.update(meta, class_name=index, uuid=id)
+        self._invalidate_query_cache(index)
 
     def get_embedding_count(
         self, filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]] = None, index: Optional[str] = None
@@ -569,7 +1062,7 @@ class WeaviateDocumentStore(BaseDocumentStore):
         index = self._sanitize_index_name(index) or self.index
         doc_count = 0
         if filters:
-            filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
+            filter_dict = _convert_filters(filters)
             result = self.weaviate_client.query.aggregate(index).with_meta_count().with_where(filter_dict).do()
         else:
             result = self.weaviate_client.query.aggregate(index).with_meta_count().do()
@@ -590,7 +1083,8 @@ class WeaviateDocumentStore(BaseDocumentStore):
         headers: Optional[Dict[str, str]] = None,
     ) -> List[Document]:
         """
-        Get documents from the document store.
+        Get documents from the document store. To iterate over many documents without loading all of them into
+        memory, use `get_all_documents_generator()`, which fetches them batch by batch.
 
         Note this limitation from the changelog of Weaviate 1.8.0:
 
@@ -655,50 +1149,79 @@ class WeaviateDocumentStore(BaseDocumentStore):
         filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]] = None,
         batch_size: int = 10_000,
         only_documents_without_embedding: bool = False,
+        properties: Optional[List[str]] = None,
+        return_embedding: bool = True,
     ) -> Generator[dict, None, None]:
         """
-        Return all documents in a specific index in the document store
+        Return all documents in a specific index in the document store.
+        By default all properties of the documents are retrieved, `properties` restricts them.
+        The vectors are only retrieved if `return_embedding` is True.
         """
         index = self._sanitize_index_name(index) or self.index
 
         # Build the properties to retrieve from Weaviate
-        properties = self._get_current_properties(index)
-        properties.append("_additional {id, certainty, vector}")
+        if properties is None:
+            properties = self._get_query_properties(index, return_embedding)
 
-        if filters:
-            filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
-            result = (
-                self.weaviate_client.query.get(class_name=index, properties=properties).with_where(filter_dict).do()
-            )
-        else:
-            result = self.weaviate_client.query.get(class_name=index, properties=properties).do()
+        filter_dict = _convert_filters(filters)
 
-        # Inherent Weaviate limitation to 100 elements forces us to loop here:
-        #   https://weaviate-python-client.readthedocs.io/en/latest/weaviate.data.html?highlight=100#weaviate.data.DataObject.get
-        base_query = self.weaviate_client.query.get(class_name=index, properties=properties)
-        all_docs: List[Any] = []
+        # Fetch the documents page by page, so that only one page of results is held in memory at a time.
+        # Paging stops at the document count: a query with an offset at Weaviate's maximum number of results
+        # (QUERY_MAXIMUM_RESULTS) fails instead of returning an empty page.
+        # .with_limit() must be used with .with_offset, of the latter won't work properly
+        #   https://weaviate-python-client.readthedocs.io/en/latest/weaviate.gql.html?highlight=offset#weaviate.gql.get.GetBuilder.with_offset
         num_of_documents = self.get_document_count(index=index, filters=filters)
-
-        while len(all_docs) < num_of_documents:
-            query = base_query
-            if filters:
-                filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
+        offset = 0
+        while offset < num_of_documents:
+            query = self.weaviate_client.query.get(class_name=index, properties=properties)
+            if filter_dict:
                 query = query.with_where(filter_dict)
+            result = query.with_limit(batch_size).with_offset(offset=offset).do()
 
-            if all_docs:
-                # .with_limit() must be used with .with_offset, of the latter won't work properly
-                #   https://weaviate-python-client.readthedocs.io/en/latest/weaviate.gql.html?highlight=offset#weaviate.gql.get.GetBuilder.with_offset
-                query = query.with_limit(100).with_offset(offset=len(all_docs))
+            hits = self._extract_hits(result, index)
+            yield from hits
+            # Documents deleted in the meantime make the last page short
+            if len(hits) < batch_size:
+                break
+            offset += len(hits)
 
-            result = query.do()
+    def _get_query_properties(self, index: str, return_embedding: bool) -> List[str]:
+        """
+        The properties to retrieve from Weaviate for documents of the index, including the additional properties.
+        The list is built once per version of the cached schema and must not be modified by the caller.
+        """
+        cur_properties, _ = self._get_schema_properties(index)
+        key = (index, return_embedding)
+        cached = self._properties_cache.get(key)
+        # The schema cache returns a new list whenever the schema was fetched again
+        if cached is None or cached[0] is not cur_properties:
+            cached = (cur_properties, cur_properties + [self._get_additional_properties(return_embedding)])
+            self._properties_cache[key] = cached
+        return cached[1]
 
-            if result and "data" in result and "Get" in result.get("data"):
-                if result.get("data").get("Get").get(index):
-                    all_docs += result.get("data").get("Get").get(index)
-            else:
-                raise ValueError(f"Weaviate returned ad exception: {result}")
+    @staticmethod
+    def _get_additional_properties(return_embedding: bool) -> str:
+        """
+        The additional properties to retrieve from Weaviate. The vector is only requested if it is returned,
+        as it is by far the largest part of a result.
+        """
+        if return_embedding:
+            return "_additional {id, certainty, vector}"
+        return "_additional {id, certainty}"
 
-        yield from all_docs
+    @staticmethod
+    def _extract_hits(result: dict, index: str, raise_on_error: bool = True) -> List[dict]:
+        """
+        Get the list of result objects of a GraphQL Get query.
+        If Weaviate returned an error instead of data, a ValueError is raised, or an empty list is returned if
+        `raise_on_error` is False.
+        """
+        try:
+            return result["data"]["Get"].get(index) or []
+        except (KeyError, TypeError, AttributeError):
+            if raise_on_error:
+                raise ValueError(f"Weaviate returned an exception: {result}")
+            return []
 
     def get_all_documents_generator(
         self,
@@ -768,10 +1291,19 @@ class WeaviateDocumentStore(BaseDocumentStore):
         if return_embedding is None:
             return_embedding = self.return_embedding
 
-        results = self._get_all_documents_in_index(index=index, filters=filters, batch_size=batch_size)
-        for result in results:
-            document = self._convert_weaviate_result_to_document(result, return_embedding=return_embedding)
-            yield document
+        results = self._get_all_documents_in_index(
+            index=index, filters=filters, batch_size=batch_size, return_embedding=return_embedding
+        )
+        for result_batch in get_batches_from_generator(results, batch_size):
+            # The embeddings of a batch are written into one contiguous buffer instead of one array per document
+            emb_out = None
+            if return_embedding:
+                emb_out = np.empty((len(result_batch), self.embedding_dim), dtype=self.embedding_dtype)
+            for row, result in enumerate(result_batch):
+                document = self._convert_weaviate_result_to_document(
+                    result, return_embedding=return_embedding, emb_out=emb_out, row=row
+                )
+                yield document
 
     def query(
         self,
@@ -780,6 +1312,7 @@ class WeaviateDocumentStore(BaseDocumentStore):
         top_k: int = 10,
         custom_query: Optional[str] = None,
         index: Optional[str] = None,
+        return_embedding: bool = True,
     ) -> List[Document]:
         """
         Scan through documents in DocumentStore and return a small number documents
@@ -853,17 +1386,18 @@ class WeaviateDocumentStore(BaseDocumentStore):
         :param custom_query: Custom query that will executed using query.raw method, for more details refer
                             https://weaviate.io/developers/weaviate/current/graphql-references/filters.html
         :param index: The name of the index in the DocumentStore from which to retrieve documents
+        :param return_embedding: Whether to return the document embeddings. Default: True. Pass False to not
+                                 retrieve the vectors from Weaviate.
         """
         index = self._sanitize_index_name(index) or self.index
 
         # Build the properties to retrieve from Weaviate
-        properties = self._get_current_properties(index)
-        properties.append("_additional {id, certainty, vector}")
+        properties = self._get_query_properties(index, return_embedding)
 
         if custom_query:
             query_output = self.weaviate_client.query.raw(custom_query)
         elif filters:
-            filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
+            filter_dict = _convert_filters(filters)
             query_output = (
                 self.weaviate_client.query.get(class_name=index, properties=properties)
                 .with_where(filter_dict)
@@ -877,14 +1411,11 @@ class WeaviateDocumentStore(BaseDocumentStore):
                 "use a custom GraphQL query in text format!"
             )
 
-        results = []
-        if query_output and "data" in query_output and "Get" in query_output.get("data"):
-            if query_output.get("data").get("Get").get(index):
-                results = query_output.get("data").get("Get").get(index)
+        results = self._extract_hits(query_output, index, raise_on_error=False)
 
         documents = []
         for result in results:
-            doc = self._convert_weaviate_result_to_document(result, return_embedding=True)
+            doc = self._convert_weaviate_result_to_document(result, return_embedding=return_embedding)
             documents.append(doc)
 
         return documents
@@ -973,48 +1504,112 @@ class WeaviateDocumentStore(BaseDocumentStore):
         if headers:
             raise NotImplementedError("WeaviateDocumentStore does not support headers.")
 
+        return self.query_by_embedding_batch(
+            query_embs=query_emb.reshape(1, -1),
+            filters=filters,
+            top_k=top_k,
+            index=index,
+            return_embedding=return_embedding,
+        )[0]
+
+    def query_by_embedding_batch(
+        self,
+        query_embs: np.ndarray,
+        filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]] = None,
+        top_k: int = 10,
+        index: Optional[str] = None,
+        return_embedding: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[List[Document]]:
+        """
+        Find the documents that are most similar to each of the provided query embeddings by using a vector
+        similarity metric. The queries are sent to Weaviate concurrently.
+
+        :param query_embs: Embeddings of the queries (e.g. gathered from DPR) as a matrix with one row per query
+        :param filters: Optional filters to narrow down the search space to documents whose metadata fulfill certain
+                        conditions. See `query_by_embedding()` for the filter format.
+        :param top_k: How many documents to return per query
+        :param index: index name for storing the docs and metadata
+        :param return_embedding: To return document embedding
+        :return: One list of documents per query embedding, in the order of the query embeddings.
+        """
+        if headers:
+            raise NotImplementedError("WeaviateDocumentStore does not support headers.")
+
         if return_embedding is None:
             return_embedding = self.return_embedding
         index = self._sanitize_index_name(index) or self.index
 
         # Build the properties to retrieve from Weaviate
-        properties = self._get_current_properties(index)
-        properties.append("_additional {id, certainty, vector}")
+        properties = self._get_query_properties(index, return_embedding)
 
+        # Copy the query embeddings into one float32 matrix and normalize all of them at once
+        query_embs = np.array(query_embs, dtype=np.float32, ndmin=2)
         if self.similarity == "cosine":
-            self.normalize_embedding(query_emb)
+            # Query batches are small, so NumPy is as fast here and needs no compiled kernel
+            _normalize_embeddings_numpy(query_embs)
 
-        query_emb = query_emb.reshape(1, -1).astype(np.float32)
+        documents: List[Optional[List[Document]]] = [None] * len(query_embs)
+        if self._query_cache is not None:
+            cache_scope = (index, json.dumps(filters, sort_keys=True, default=str), top_k, return_embedding)
+            documents = [self._query_cache.get(cache_scope, query_emb) for query_emb in query_embs]
+        missing = [i for i, cached in enumerate(documents) if cached is None]
+        if not missing:
+            return documents  # type: ignore
 
-        query_string = {"vector": query_emb}
-        if filters:
-            filter_dict = LogicalFilterClause.parse(filters).convert_to_weaviate()
-            query_output = (
-                self.weaviate_client.query.get(class_name=index, properties=properties)
-                .with_where(filter_dict)
-                .with_near_vector(query_string)
-                .with_limit(top_k)
-                .do()
-            )
-        else:
-            query_output = (
-                self.weaviate_client.query.get(class_name=index, properties=properties)
-                .with_near_vector(query_string)
-                .with_limit(top_k)
-                .do()
-            )
+        query_prefix, query_suffix = self._get_near_vector_query_template(index, properties, filters, top_k)
 
-        results = []
-        if query_output and "data" in query_output and "Get" in query_output.get("data"):
-            if query_output.get("data").get("Get").get(index):
-                results = query_output.get("data").get("Get").get(index)
+        def run_query(query_emb: np.ndarray) -> List[dict]:
+            query_output = self.weaviate_client.query.raw(query_prefix + _json_dumps(query_emb.tolist()) + query_suffix)
+            return self._extract_hits(query_output, index, raise_on_error=False)
 
-        documents = []
-        for result in results:
-            doc = self._convert_weaviate_result_to_document(result, return_embedding=return_embedding)
-            documents.append(doc)
+        results = self._map_concurrently(run_query, [query_embs[i] for i in missing])
 
-        return documents
+        for i, hits in zip(missing, results):
+            documents[i] = [
+                self._convert_weaviate_result_to_document(hit, return_embedding=return_embedding) for hit in hits
+            ]
+            if self._query_cache is not None:
+                self._query_cache.put(cache_scope, query_embs[i], documents[i])  # type: ignore
+        return documents  # type: ignore
+
+    def _get_near_vector_query_template(
+        self,
+        index: str,
+        properties: List[str],
+        filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]],
+        top_k: int,
+    ) -> Tuple[str, str]:
+        """
+        Get the GraphQL nearVector query of the given index, properties, filters and top_k split at the query vector,
+        so that a query only needs the vector to be serialized. The query is built once with the client's query
+        builder and cached.
+        """
+        try:
+            key = (index, tuple(properties), _freeze(filters), top_k)
+            template = self._query_template_cache.get(key)
+        except TypeError:
+            # Filters with unhashable values can't be cached
+            key, template = None, None
+        if template is not None:
+            return template
+
+        query = self.weaviate_client.query.get(class_name=index, properties=properties)
+        filter_dict = _convert_filters(filters)
+        if filter_dict:
+            query = query.with_where(filter_dict)
+        # The nearVector argument is the last argument of the query, so its last occurrence is the placeholder
+        placeholder = "nearVector: {vector: [0.0]"
+        query_prefix, _, query_suffix = (
+            query.with_near_vector({"vector": [0.0]}).with_limit(top_k).build().rpartition(placeholder)
+        )
+        template = (query_prefix + "nearVector: {vector: ", query_suffix)
+
+        if key is not None:
+            if len(self._query_template_cache) >= 256:
+                self._query_template_cache.pop(next(iter(self._query_template_cache)))
+            self._query_template_cache[key] = template
+        return template
 
     def update_embeddings(
         self,
@@ -1066,33 +1661,72 @@ class WeaviateDocumentStore(BaseDocumentStore):
         if not self.embedding_field:
             raise RuntimeError("Specify the arg `embedding_field` when initializing WeaviateDocumentStore()")
 
-        if update_existing_embeddings:
-            logger.info(f"Updating embeddings for all {self.get_document_count(index=index)} docs ...")
-        else:
+        if not update_existing_embeddings:
             raise RuntimeError(
                 "All the documents in Weaviate store have an embedding by default. Only update is allowed!"
             )
+        document_count = self.get_document_count(index=index)
+        logger.info(f"Updating embeddings for all {document_count} docs ...")
+        if document_count == 0:
+            return
 
-        result = self._get_all_documents_in_index(index=index, filters=filters, batch_size=batch_size)
+        # Collect the ids first: updated objects can change their position in the results, so paging through
+        # the documents while updating them could skip or repeat documents.
+        id_hits = self._get_all_documents_in_index(
+            index=index, filters=filters, batch_size=batch_size, properties=["_additional {id}"]
+        )
+        ids = [hit["_additional"]["id"] for hit in id_hits]
+        id_batches = get_batches_from_generator(ids, batch_size)
 
-        for result_batch in get_batches_from_generator(result, batch_size):
-            document_batch = [
-                self._convert_weaviate_result_to_document(hit, return_embedding=False) for hit in result_batch
-            ]
-            embeddings = retriever.embed_documents(document_batch)  # type: ignore
-            assert len(document_batch) == len(embeddings)
-
-            if embeddings[0].shape[0] != self.embedding_dim:
-                raise RuntimeError(
-                    f"Embedding dim. of model ({embeddings[0].shape[0]})"
-                    f" doesn't match embedding dim. in DocumentStore ({self.embedding_dim})."
-                    "Specify the arg `embedding_dim` when initializing WeaviateDocumentStore()"
-                )
-            for doc, emb in zip(document_batch, embeddings):
-                # Using update method to only update the embeddings, other properties will be in tact
+        properties = self._get_current_properties(index)
+        properties.append("_additional {id}")
+
+        def fetch_next_batch() -> Optional[List[dict]]:
+            id_batch = next(id_batches, None)
+            if id_batch is None:
+                return None
+            return self._get_documents_by_id_batch(id_batch, index, properties)
+
+        def update_embedding(item: Tuple[str, np.ndarray]):
+            # An update only patches the vector, the properties of the object are kept as they are on the server
+            id, embedding = item
+            self.weaviate_client.data_object.update({}, class_name=index, uuid=id, vector=embedding)
+
+        # The next batch of documents is fetched in the background while the current one is embedded
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_batch = executor.submit(fetch_next_batch)
+            while True:
+                result_batch = next_batch.result()
+                if result_batch is None:
+                    break
+                next_batch = executor.submit(fetch_next_batch)
+
+                document_batch = [
+                    self._convert_weaviate_result_to_document(hit, return_embedding=False) for hit in result_batch
+                ]
+                if not document_batch:
+                    continue
+                embeddings = retriever.embed_documents(document_batch)  # type: ignore
+                assert len(document_batch) == len(embeddings)
+
+                if embeddings[0].shape[0] != self.embedding_dim:
+                    raise RuntimeError(
+                        f"Embedding dim. of model ({embeddings[0].shape[0]})"
+                        f" doesn't match embedding dim. in DocumentStore ({self.embedding_dim})."
+                        "Specify the arg `embedding_dim` when initializing WeaviateDocumentStore()"
+                    )
+                self._write_embedding_cache(document_batch, embeddings)
+
+                # Normalize the embeddings of the whole batch at once. A float32 matrix from the retriever is
+                # normalized in place, as it isn't used after this point.
+                embedding_matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
                 if self.similarity == "cosine":
-                    self.normalize_embedding(emb)
-                self.weaviate_client.data_object.update({}, class_name=index, uuid=doc.id, vector=emb)
+                    _normalize_embeddings_batch(embedding_matrix)
+
+                self._map_concurrently(
+                    update_embedding, [(doc.id, emb) for doc, emb in zip(document_batch, embedding_matrix)]
+                )
+        self._invalidate_query_cache(index)
 
     def delete_all_documents(
         self,
@@ -1191,18 +1825,54 @@ class WeaviateDocumentStore(BaseDocumentStore):
 
         index = self._sanitize_index_name(index) or self.index
 
-        # create index if it doesn't exist yet
-        self._create_schema_and_index_if_not_exist(index)
-
         if not filters and not ids:
-            self.weaviate_client.schema.delete_class(index)
+            # Deleting and recreating the class of an empty index would only recreate the same empty index,
+            # it only has to be created if it doesn't exist yet
+            if self.get_document_count(index=index) == 0:
+                self._create_schema_and_index_if_not_exist(index)
+                return
+            try:
+                self.weaviate_client.schema.delete_class(index)
+            except weaviate.exceptions.UnexpectedStatusCodeException as usce:
+                if usce.status_code != 404:
+                    raise
+                logger.debug(f"Weaviate could not delete the class '{index}' as it doesn't exist: {usce}")
+            self._schema_cache.pop(index, None)
+            self._schema_ensured.discard(index)
             self._create_schema_and_index_if_not_exist(index)
         else:
-            docs_to_delete = self.get_all_documents(index, filters=filters)
-            if ids:
-                docs_to_delete = [doc for doc in docs_to_delete if doc.id in ids]
-            for doc in docs_to_delete:
-                self.weaviate_client.data_object.delete(doc.id)
+            # create index if it doesn't exist yet, so that the queries for the ids to delete don't fail
+            self._create_schema_and_index_if_not_exist(index)
+            ids_to_delete = self._get_matching_ids(index=index, ids=ids, filters=filters)
+            # This version of the client has no batch delete, so the deletes are sent concurrently
+            self._map_concurrently(self.weaviate_client.data_object.delete, ids_to_delete)
+        self._invalidate_query_cache(index)
+
+    def _get_matching_ids(
+        self,
+        index: str,
+        ids: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Union[Dict, List, str, int, float, bool]]] = None,
+        batch_size: int = 10_000,
+    ) -> List[str]:
+        """
+        Get the ids of the documents that have one of the given ids and match the filters.
+        Both conditions are evaluated by Weaviate and only the ids of the matching documents are retrieved.
+        """
+        properties = ["_additional {id}"]
+        if not ids:
+            hits = self._get_all_documents_in_index(
+                index=index, filters=filters, batch_size=batch_size, properties=properties
+            )
+            return [hit["_additional"]["id"] for hit in hits]
+
+        filter_dict = _convert_filters(filters)
+        sanitized_ids = [self._sanitize_id(id=id, index=index) for id in ids]
+        matching_ids: List[str] = []
+        for id_batch in get_batches_from_generator(sanitized_ids, batch_size):
+            batch_hits = self._get_documents_by_id_batch(id_batch, index, properties, filter_dict)
+            matching_ids.extend(hit["_additional"]["id"] for hit in batch_hits)
+        return matching_ids
 
     def delete_index(self, index: str):
         """
@@ -1217,6 +1887,9 @@ class WeaviateDocumentStore(BaseDocumentStore):
                 f"If you plan to use this index again, please reinstantiate '{self.__class__.__name__}' in order to avoid side-effects."
             )
         self.weaviate_client.schema.delete_class(index)
+        self._schema_cache.clear()
+        self._schema_ensured.discard(self._sanitize_index_name(index))
+        self._invalidate_query_cache(self._sanitize_index_name(index))
 
     def delete_labels(self):
         """
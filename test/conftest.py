@@ -843,9 +843,15 @@ def get_document_store(
 
     elif document_store_type == "weaviate":
         document_store = WeaviateDocumentStore(
-            weaviate_url="http://localhost:8080", index=index, similarity=similarity, embedding_dim=embedding_dim
+            weaviate_url="http://localhost:8080",
+            index=index,
+            similarity=similarity,
+            embedding_dim=embedding_dim,
+            return_embedding=True,
         )
         document_store.weaviate_client.schema.delete_all()
+        # The schema was deleted bypassing the document store, so its record of existing indices is outdated
+        document_store._schema_ensured.clear()
         document_store._create_schema_and_index_if_not_exist()
 
     elif document_store_type == "pinecone":
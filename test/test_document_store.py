@@ -476,12 +476,8 @@ def test_document_with_embeddings(document_store: BaseDocumentStore):
     document_store.write_documents(documents, index="haystack_test_one")
     assert len(document_store.get_all_documents(index="haystack_test_one")) == 4
 
-    if not isinstance(document_store, WeaviateDocumentStore):
-        # weaviate is excluded because it would return dummy vectors instead of None
-        documents_without_embedding = document_store.get_all_documents(
-            index="haystack_test_one", return_embedding=False
-        )
-        assert documents_without_embedding[0].embedding is None
+    documents_without_embedding = document_store.get_all_documents(index="haystack_test_one", return_embedding=False)
+    assert documents_without_embedding[0].embedding is None
 
     documents_with_embedding = document_store.get_all_documents(index="haystack_test_one", return_embedding=True)
     assert isinstance(documents_with_embedding[0].embedding, (list, np.ndarray))
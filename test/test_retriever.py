@@ -194,6 +194,7 @@ def test_retribert_embedding(document_store, retriever, docs):
             weaviate_url="http://localhost:8080", index="haystack_test", embedding_dim=128
         )
         document_store.weaviate_client.schema.delete_all()
+        document_store._schema_ensured.clear()
         document_store._create_schema_and_index_if_not_exist()
     document_store.return_embedding = True
     document_store.write_documents(docs)
@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 from haystack.schema import Document
+from haystack.document_stores.weaviate import WeaviateDocumentStore
 from .conftest import get_document_store
 import uuid
 
@@ -90,6 +91,23 @@ def test_query_by_embedding(document_store_with_docs):
     assert len(docs) == 1
 
 
+@pytest.mark.weaviate
+@pytest.mark.parametrize("document_store_with_docs", ["weaviate"], indirect=True)
+def test_query_by_embedding_batch(document_store_with_docs):
+    query_embs = np.random.rand(2, embedding_dim).astype(np.float32)
+    results = document_store_with_docs.query_by_embedding_batch(query_embs, top_k=2)
+    assert len(results) == 2
+    assert all(len(docs) == 2 for docs in results)
+
+    # The batch returns the same documents as the single queries
+    for query_emb, docs in zip(query_embs, results):
+        single_docs = document_store_with_docs.query_by_embedding(query_emb, top_k=2)
+        assert [doc.id for doc in docs] == [doc.id for doc in single_docs]
+
+    results = document_store_with_docs.query_by_embedding_batch(query_embs, filters={"name": ["filename2"]})
+    assert all(len(docs) == 1 for docs in results)
+
+
 @pytest.mark.weaviate
 @pytest.mark.parametrize("document_store_with_docs", ["weaviate"], indirect=True)
 def test_query(document_store_with_docs):
@@ -105,3 +123,70 @@ def test_query(document_store_with_docs):
 
     docs = document_store_with_docs.query(filters={"content": ["live"]})
     assert len(docs) == 3
+
+
+@pytest.mark.weaviate
+def test_weaviate_embedding_cache(tmp_path):
+    document_store = WeaviateDocumentStore(
+        index="haystack_test_embedding_cache",
+        embedding_dim=embedding_dim,
+        embedding_cache_path=str(tmp_path / "embedding_cache"),
+    )
+    embedding = np.random.rand(embedding_dim).astype(np.float32)
+    document_store.write_documents([{"content": "text1", "id": get_uuid(), "embedding": embedding}])
+
+    # Same content without an embedding gets the cached embedding instead of a dummy one
+    new_id = get_uuid()
+    document_store.write_documents([{"content": "text1", "id": new_id}])
+    document = document_store.get_document_by_id(new_id)
+    assert np.allclose(document.embedding, embedding / np.linalg.norm(embedding), rtol=0.01)
+
+    # The cache file can be shared with another document store
+    other_document_store = WeaviateDocumentStore(
+        index="haystack_test_embedding_cache_other",
+        embedding_dim=embedding_dim,
+        embedding_cache_path=str(tmp_path / "embedding_cache"),
+    )
+    other_id = get_uuid()
+    other_document_store.write_documents([{"content": "text1", "id": other_id}])
+    document = other_document_store.get_document_by_id(other_id)
+    assert np.allclose(document.embedding, embedding / np.linalg.norm(embedding), rtol=0.01)
+
+    document_store.delete_index(document_store.index)
+    other_document_store.delete_index(other_document_store.index)
+
+
+@pytest.mark.weaviate
+def test_weaviate_query_cache():
+    document_store = WeaviateDocumentStore(
+        index="haystack_test_query_cache", embedding_dim=embedding_dim, query_cache_size=10
+    )
+    document_store.write_documents(DOCUMENTS)
+    query_emb = np.random.rand(embedding_dim).astype(np.float32)
+    docs = document_store.query_by_embedding(query_emb, top_k=2)
+
+    # Repeated and near-identical queries are answered from the cache
+    cached_docs = document_store.query_by_embedding(query_emb * 2, top_k=2)
+    assert [doc.id for doc in cached_docs] == [doc.id for doc in docs]
+
+    # Writing to the index invalidates the cached results
+    document_store.write_documents([{"content": "text6", "id": get_uuid(), "embedding": query_emb}])
+    docs = document_store.query_by_embedding(query_emb, top_k=2)
+    assert docs[0].content == "text6"
+
+    document_store.delete_index(document_store.index)
+
+
+@pytest.mark.weaviate
+def test_weaviate_write_property_added_by_other_store():
+    index = "haystack_test_outdated_schema"
+    document_store = WeaviateDocumentStore(index=index, embedding_dim=embedding_dim)
+    other_document_store = WeaviateDocumentStore(index=index, embedding_dim=embedding_dim)
+    document_store.write_documents([{"content": "text1", "id": get_uuid()}])
+
+    # The property is unknown to the cached schema of the first store
+    other_document_store.write_documents([{"content": "text2", "id": get_uuid(), "meta": {"date": "2021-01-01"}}])
+    document_store.write_documents([{"content": "text3", "id": get_uuid(), "meta": {"date": "2022-01-01"}}])
+    assert document_store.get_document_count() == 3
+
+    document_store.delete_index(index)